@@ -1,9 +1,239 @@
 #!/usr/bin/env python
-import numpy
+import itertools
+import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import colorConverter
+from matplotlib.figure import Figure
 from ss_plotting import plot_utils
 import ss_plotting.colors as colors
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Generator.normal is faster than the legacy RandomState, which older numpy versions only have.
+# This default generator is not affected by np.random.seed, pass rng to plot for reproducible jitter.
+if hasattr(np.random, 'default_rng'):
+    _rng = np.random.default_rng()
+else:
+    _rng = np.random
+
+_plot_color_cache = {}
+
+def _get_plot_color(color=None, emphasis=False):
+    """
+    Memoized version of colors.get_plot_color
+    Only color names are cached, so the cache is bounded by the names in use.
+    RGB(A) sequences are converted every time.
+    """
+    if not isinstance(color, str):
+        return colors.get_plot_color(color, emphasis=emphasis)
+    key = (color, bool(emphasis))
+    try:
+        return _plot_color_cache[key]
+    except KeyError:
+        plot_color = _plot_color_cache[key] = colors.get_plot_color(color, emphasis=emphasis)
+        return plot_color
+
+_NON_INTERACTIVE_BACKENDS = ('agg', 'cairo', 'pdf', 'pgf', 'ps', 'svg', 'template')
+
+def _is_non_interactive():
+    """
+    @return True if the current matplotlib backend cannot display figures on the screen
+    """
+    return matplotlib.get_backend().lower() in _NON_INTERACTIVE_BACKENDS
+
+def _figure_and_axis(fig, ax, show_plot):
+    """
+    Get the figure and axis to draw a plot in
+    @param fig The figure to draw in, if None and ax is None a new figure is created
+    @param ax The axis to draw in, if None the first axis of fig is used (one is added if fig has none)
+    @param show_plot If True, a new figure is created through pyplot so it can be shown
+       (or picked up with plt.gcf()). Otherwise it is created with an Agg canvas and is not tracked by pyplot.
+    @return fig, ax
+    """
+    if ax is not None:
+        return ax.figure, ax
+    if fig is None:
+        if show_plot:
+            return plt.subplots()
+        fig = Figure()
+        FigureCanvasAgg(fig)
+    elif fig.axes:
+        # Reuse the axis instead of stacking a new one on every call
+        return fig, fig.axes[0]
+    return fig, fig.add_subplot(111)
+
+def _palette(series_colors, series_color_emphasis=None):
+    """
+    Look up the plot color of every series
+    @param series_colors List of colors for each series
+    @param series_color_emphasis List of booleans, one for each series, if None no series is bold
+    @return A (num_series, 4) array with the RGBA values of each series color
+    """
+    if series_color_emphasis is None:
+        series_color_emphasis = itertools.repeat(False)
+    return np.array([colorConverter.to_rgba(_get_plot_color(c, emphasis=e))
+                     for c, e in zip(series_colors, series_color_emphasis)])
+
+def _rc_matches(key, value):
+    """
+    @return True if plt.rcParams[key] already holds value
+       (string values are stored as one element lists for list valued keys such as font.family)
+    """
+    current = plt.rcParams[key]
+    if isinstance(value, str) and isinstance(current, list):
+        return current == [value]
+    return current == value
+
+def _configure_fonts(fontsize, legend_fontsize):
+    """
+    Call plot_utils.configure_fonts unless the live rcParams already hold every
+    setting it would apply (e.g. from the previous plot with the same font sizes)
+    """
+    settings = plot_utils.font_settings(fontsize=fontsize, legend_fontsize=legend_fontsize)
+    if all(_rc_matches(key, value) for key, value in settings.items()):
+        return
+    plot_utils.configure_fonts(fontsize=fontsize, legend_fontsize=legend_fontsize)
+
+def _default_or_check(values, num_series, default, message):
+    """
+    Fill in a per-series argument or verify its length
+    @param values The list of values supplied by the caller, or None
+    @param num_series The number of series being plotted
+    @param default The value to use for every series if values is None
+    @param message The message of the ValueError raised on a length mismatch
+    @return A list with one entry for each series
+    """
+    if values is None:
+        values = list(itertools.repeat(default, num_series))
+    elif len(values) != num_series:
+        raise ValueError(message)
+    return values
+
+def _series_arrays(series):
+    """
+    Convert the (xvals, yvals) tuples passed to plot into arrays
+    @param series List of (xvals, yvals) for each series, or a (num_series, 2, N) array
+    @return X, Y Two lists holding one array per series, or for array input two 2D views
+       with one row per series. xvals are broadcast to the shape of yvals.
+       ndarray values passed by the caller are not copied.
+    """
+    if isinstance(series, np.ndarray) and series.ndim == 3 and series.shape[1] == 2:
+        return series[:, 0], series[:, 1]
+    ys = [np.asarray(s[1]) for s in series]
+    xs = [np.broadcast_to(s[0], y.shape) for s, y in zip(series, ys)]
+    return xs, ys
+
+def _stack_series(X, Y):
+    """
+    Stack the per-series values returned by _series_arrays for the vectorized jitter paths
+    @param X, Y The x and y values returned by _series_arrays
+    @return X, Y If every series has the same length, two 2D arrays with one row per series
+       (this copies the values). Otherwise X and Y unchanged.
+    """
+    if isinstance(Y, np.ndarray):
+        return X, Y
+    shape = Y[0].shape
+    if len(shape) == 1 and all(y.shape == shape for y in Y):
+        return np.vstack(X), np.vstack(Y)
+    return X, Y
+
+def _jitter(vals, scale, rng):
+    """
+    Add normally distributed jitter to the values returned by _series_arrays
+    @param vals A 2D array, or a list of arrays, of values
+    @param scale The scale of the normal distribution
+    @param rng The np.random.Generator or RandomState to draw the jitter from
+    @return The jittered values, in the same layout as vals
+    """
+    normal = rng.normal
+    if isinstance(vals, np.ndarray):
+        return normal(vals, scale)
+    return [normal(v, scale) for v in vals]
+
+# Below this many points per axis the numba kernel's thread start-up (and the
+# compile time of the first call) costs more than the numpy jitter it replaces
+_COMPILED_JITTER_MIN_SIZE = 100000
+
+if numba is not None:
+    @numba.njit(parallel=True, cache=True)
+    def _apply_jitter(xvals, yvals, jx, jy, out_x, out_y):
+        """
+        Write xvals and yvals plus normally distributed jitter into out_x and out_y
+        All arrays are 1D float64 arrays of the same length. Scales must be non-negative,
+        an axis with scale 0. is copied without jitter.
+        """
+        for i in numba.prange(xvals.shape[0]):
+            if jx > 0.:
+                out_x[i] = xvals[i] + np.random.normal(0., jx)
+            else:
+                out_x[i] = xvals[i]
+            if jy > 0.:
+                out_y[i] = yvals[i] + np.random.normal(0., jy)
+            else:
+                out_y[i] = yvals[i]
+else:
+    _apply_jitter = None
+
+def _jitter_compiled(X, Y, jitter_x, jitter_y):
+    """
+    Jitter stacked series values with the numba kernel _apply_jitter
+    @param X, Y The x and y values, as 2D arrays of the same shape
+    @param jitter_x, jitter_y The non-negative scales of the jitter, -1. disables jitter along that axis
+    @return X, Y The jittered values as new 2D arrays
+    """
+    jx = 0. if jitter_x == -1. else float(jitter_x)
+    jy = 0. if jitter_y == -1. else float(jitter_y)
+    X = np.ascontiguousarray(X, dtype=np.float64)
+    Y = np.ascontiguousarray(Y, dtype=np.float64)
+    out_x = np.empty_like(X)
+    out_y = np.empty_like(Y)
+    _apply_jitter(X.ravel(), Y.ravel(), jx, jy, out_x.ravel(), out_y.ravel())
+    return out_x, out_y
+
+def _plot_bars_fast(ax, series, positions, palette, series_labels,
+                    barwidth, horizontal, base_style):
+    """
+    Draw the bars of a bar graph without error bars, stacking or series styles using a single call
+    @param ax The axis to draw the bars on
+    @param series List of data for each series, all of the same length
+    @param positions The (num_series, num_categories) positions of every bar
+    @param palette The (num_series, 4) RGBA colors of the series
+    @param series_labels List of labels for each series
+    @param barwidth The width of each bar
+    @param horizontal Plot bars horizontally instead of vertically
+    @param base_style The style arguments shared by all bars
+    """
+    num_categories = positions.shape[1]
+    heights = np.asarray(series, dtype=np.float64).ravel()
+    positions = positions.ravel()
+    flat_colors = np.repeat(palette, num_categories, axis=0)
+    if horizontal:
+        bars = ax.barh(
+            bottom = positions,
+            height = barwidth,
+            width = heights,
+            color = flat_colors,
+            **base_style
+        )
+    else:
+        bars = ax.bar(
+            left = positions,
+            height = heights,
+            width = barwidth,
+            color = flat_colors,
+            **base_style
+        )
+
+    # Label the first bar of each series so the usual legend lookup finds one entry per series
+    for idx, label in enumerate(series_labels):
+        if label is not None:
+            bars[idx * num_categories].set_label(label)
+
 def plot_bar_graph(series, series_colors,
                    series_labels=None,
                    series_color_emphasis=None, 
@@ -28,7 +258,9 @@ def plot_bar_graph(series, series_colors,
                    savefile = None,
                    savefile_size = (3.4, 1.5),
                    horizontal = False,
-                   show_plot = True):
+                   show_plot = True,
+                   fig = None,
+                   ax = None):
     """
     Plot a bar graph 
     @param series List of data for each series - each of these will be plotted in a different color
@@ -55,6 +287,14 @@ def plot_bar_graph(series, series_colors,
     @param savefile_size The size of the saved plot
     @param horizontal Plot bars horizontally instead of vertically
     @param show_plot If True, display the plot on the screen via a call to plt.show()
+       (skipped when the matplotlib backend is non-interactive). If False, a new figure
+       is created outside of pyplot, so it is not returned by plt.gcf() or shown by plt.show()
+    @param fig The figure to draw in, if None a new figure is created. If fig already has axes
+       the plot is drawn into its first axis, otherwise an axis is added
+    @param ax The axis to draw in, if None the axis is taken from fig as described above.
+       The existing content of a reused figure or axis is kept and the plot is drawn on top of it.
+       Clear it first (fig.clf() or ax.cla()) to start from an empty plot; the axis lines
+       are also added again on every call
     @return fig, ax The figure and axis the plot was created in
     """
 
@@ -62,80 +302,90 @@ def plot_bar_graph(series, series_colors,
     if series is None or len(series) == 0:
         raise ValueError('No data series')
     num_series = len(series)
+    num_categories = len(series[0])
 
     if len(series_colors) != num_series:
         raise ValueError('You must define a color for every series')
         
-    if series_labels is None:
-        series_labels = [None for l in range(num_series)]
-    if len(series_labels) != num_series:
-        raise ValueError('You must define a label for every series')
-
-    if series_errs is None:
-        series_errs = [None for _ in series]
-    if len(series_errs) != num_series:
-        raise ValueError('series_errs is not None. Must provide error value for every series.')
-
-    if series_err_colors is None:
-        series_err_colors = ['black' for _ in series]
-    if len(series_err_colors) != num_series:
-        raise ValueError('Must provide an error bar color for every series')
-
-    if series_color_emphasis is None:
-        series_color_emphasis = [False for _ in series]
-    if len(series_color_emphasis) != num_series:
-        raise ValueError('The emphasis list must be the same length as the series_colors list')
-
-    if series_use_labels and len(series[0]) > 1:
+    series_labels = _default_or_check(series_labels, num_series, None,
+        'You must define a label for every series')
+    series_errs = _default_or_check(series_errs, num_series, None,
+        'series_errs is not None. Must provide error value for every series.')
+    series_err_colors = _default_or_check(series_err_colors, num_series, 'black',
+        'Must provide an error bar color for every series')
+    series_color_emphasis = _default_or_check(series_color_emphasis, num_series, False,
+        'The emphasis list must be the same length as the series_colors list')
+
+    if series_use_labels and num_categories > 1:
         raise ValueError('Only series containing one category may be labeled.')
 
     if series_style is None:
-        series_style = [dict() for _ in series]
+        series_style = [dict() for _ in range(num_series)]
 
-    fig, ax = plt.subplots()
-    plot_utils.configure_fonts(fontsize=fontsize, legend_fontsize=legend_fontsize)
+    fig, ax = _figure_and_axis(fig, ax, show_plot)
+    _configure_fonts(fontsize, legend_fontsize)
+
+    # The category axis is y for horizontal bars and x otherwise
+    if horizontal:
+        set_ticks, set_ticklabels, set_lim = ax.set_yticks, ax.set_yticklabels, ax.set_ylim
+    else:
+        set_ticks, set_ticklabels, set_lim = ax.set_xticks, ax.set_xticklabels, ax.set_xlim
 
-    if plot_yinvert:
+    # invert_yaxis toggles, so do not flip back an axis that is reused
+    if plot_yinvert and not ax.yaxis_inverted():
       ax.invert_yaxis()
 
     spacing = category_padding*barwidth
-    num_categories = len(series[0])
     category_width = spacing + num_series*barwidth 
     if stacked:
         category_width = spacing+barwidth 
-    index = numpy.array(range(num_categories)) * category_width + xpadding
-
-    for idx in range(num_series):
-        offset = idx * (barwidth + series_padding)
-        if stacked:
-            offset = 0.
-
-        style = dict(
-            label = series_labels[idx],
-            color = colors.get_plot_color(
-                series_colors[idx], emphasis=series_color_emphasis[idx]),
-            ecolor = colors.get_plot_color(series_err_colors[idx]),
-            linewidth = 0,
-        )
-        style.update(series_style[idx])
-
-        if horizontal:
-            r = ax.barh(
-                bottom = index + offset, 
-                #left = index + offset,
-                height = barwidth, #series[idx],
-                width = series[idx],# barwidth,
-                xerr = series_errs[idx],
-                **style
-            )
-        else:
-            r = ax.bar(
-                left = index + offset,
-                height = series[idx],
-                width = barwidth,
-                yerr = series_errs[idx],
-                **style
+    index = np.arange(num_categories, dtype=np.float64) * category_width + xpadding
+    if stacked:
+        offsets = np.zeros(num_series)
+    else:
+        offsets = np.arange(num_series) * (barwidth + series_padding)
+    positions = index[None, :] + offsets[:, None]
+
+    palette = _palette(series_colors, series_color_emphasis)
+    has_errs = any(e is not None for e in series_errs)
+    # Error colors are only looked up when there are error bars to draw
+    err_palette = _palette(series_err_colors) if has_errs else None
+    base_style = dict(linewidth = 0)
+
+    # Without error bars, stacking or per-series styles every bar can be drawn with one call
+    if (not stacked
+            and not has_errs
+            and not any(series_style)
+            and all(len(s) == num_categories for s in series)):
+        _plot_bars_fast(ax, series, positions, palette, series_labels,
+                        barwidth, horizontal, base_style)
+    else:
+        for idx in range(num_series):
+            style = dict(base_style,
+                label = series_labels[idx],
+                color = palette[idx],
             )
+            if err_palette is not None:
+                style['ecolor'] = err_palette[idx]
+            style.update(series_style[idx])
+
+            if horizontal:
+                r = ax.barh(
+                    bottom = positions[idx], 
+                    #left = positions[idx],
+                    height = barwidth, #series[idx],
+                    width = series[idx],# barwidth,
+                    xerr = series_errs[idx],
+                    **style
+                )
+            else:
+                r = ax.bar(
+                    left = positions[idx],
+                    height = series[idx],
+                    width = barwidth,
+                    yerr = series_errs[idx],
+                    **style
+                )
     
     # Label the plot
     if plot_ylabel is not None:
@@ -147,39 +397,26 @@ def plot_bar_graph(series, series_colors,
     
     # Add category tick marks
     if series_use_labels:
-        indices = numpy.arange(num_series)
+        indices = np.arange(num_series)
         ticks = xpadding + indices * (barwidth + series_padding) + 0.5 * barwidth
-        if horizontal:
-            ax.set_yticks(ticks)
-        else:
-            ax.set_xticks(ticks)
+        set_ticks(ticks)
 
         if series_labels is not None:
-            if horizontal:
-                ax.set_yticklabels(series_labels)
-            else:
-                ax.set_xticklabels(series_labels)
+            set_ticklabels(series_labels)
     elif category_ticks:
+        # index is not needed past this point, so shift it in place
+        ticks = index
         if not stacked:
-            ticks = index + (num_series/2.)*barwidth
+            ticks += (num_series/2.)*barwidth
         else:
-            ticks = index + .5*barwidth
+            ticks += .5*barwidth
 
-        if horizontal:
-            ax.set_yticks(ticks)
-        else:
-            ax.set_xticks(ticks)
+        set_ticks(ticks)
 
         if category_labels is not None:
-            if horizontal:
-                ax.set_yticklabels(category_labels)
-            else:
-                ax.set_xticklabels(category_labels)
+            set_ticklabels(category_labels)
     else:
-        if horizontal:
-            ax.set_yticks([])
-        else:
-            ax.set_xticks([])
+        set_ticks([])
 
     # Set the x-axis limits
     lims = [ 0,
@@ -187,10 +424,7 @@ def plot_bar_graph(series, series_colors,
              + num_categories * (category_width + (num_series - 1) * series_padding)
              - spacing
     ]
-    if horizontal:
-        ax.set_ylim(lims)
-    else:
-        ax.set_xlim(lims)
+    set_lim(lims)
 
     # Legend
     if legend_location is not None:
@@ -207,7 +441,7 @@ def plot_bar_graph(series, series_colors,
                           )
         
     # Show
-    if show_plot:
+    if show_plot and not _is_non_interactive():
         plt.show()
 
     return fig, ax
@@ -238,10 +472,14 @@ def plot(series, series_colors,
          y_scale = 'linear',
          plot_markers = None,
          line_styles = None,
-         mark_every=1):
+         mark_every=1,
+         fig = None,
+         ax = None,
+         rng = None):
     """
     Plot yvals as a function of xvals
     @param series List of (xvals, yvals) for each series- each of these will be plotted in a different color
+       A (num_series, 2, N) array is also accepted and used without copying it
     @param series_labels List of labels for each series - same length as series
     @param series_colors List of colors for each series - same length as series
     @param series_color_emphasis List of booleans, one for each series, indicating whether the series
@@ -261,6 +499,8 @@ def plot(series, series_colors,
     @param savefile The path to save the plot to, if None plot is not saved
     @param savefile_size The size of the saved plot
     @param show_plot If True, display the plot on the screen via a call to plt.show()
+       (skipped when the matplotlib backend is non-interactive). If False, a new figure
+       is created outside of pyplot, so it is not returned by plt.gcf() or shown by plt.show()
     @param x_scale set to log or linear for the x axis
     @param y_scale set to log or linear for the y axis
     @param plot_markers if not None, a list of line marker symbols
@@ -269,7 +509,17 @@ def plot(series, series_colors,
     @param marker_size 
     @param jitter_x the scale of the normal distribution for jitter along x direction, if -1., then no jitter along x 
     @param jitter_y the scale of the normal distribution for jitter along y direction, if -1., then no jitter along y 
+       The jitter is not affected by np.random.seed, pass rng to make it reproducible
     @param jitter_alpha the alpha value for jittered scatter points
+    @param rng The np.random.Generator (or RandomState) to draw the jitter from, e.g.
+       np.random.default_rng(seed). If None a module level generator is used and large plots
+       may be jittered by numba, whose random state is separate from numpy's
+    @param fig The figure to draw in, if None a new figure is created. If fig already has axes
+       the plot is drawn into its first axis, otherwise an axis is added
+    @param ax The axis to draw in, if None the axis is taken from fig as described above.
+       The existing content of a reused figure or axis is kept and the plot is drawn on top of it.
+       Clear it first (fig.clf() or ax.cla()) to start from an empty plot; the axis lines
+       are also added again on every call
     @return fig, ax The figure and axis the plot was created in
     """
 
@@ -281,62 +531,63 @@ def plot(series, series_colors,
     if len(series_colors) != num_series:
         raise ValueError('You must define a color for every series')
         
-    if series_labels is None:
-        series_labels = [None for s in series]
-    if len(series_labels) != num_series:
-        raise ValueError('You must define a label for every series')
-
-    if series_errs is None:
-        series_errs = [None for s in series]
-    if len(series_errs) != num_series:
-        raise ValueError('series_errs is not None. Must provide error value for every series.')
-
-    if series_err_colors is None:
-        series_err_colors = ['black' for s in series]
-    if len(series_err_colors) != num_series:
-        raise ValueError('Must provide an error bar color for every series')
-
-    if series_color_emphasis is None:
-        series_color_emphasis = [False for s in series]
-    if len(series_color_emphasis) != num_series:
-        raise ValueError('The emphasis list must be the same length as the series_colors list')
-
-    if plot_markers is None:
-        plot_markers = ['None' for s in series]
-    if len(plot_markers ) != num_series:
-        raise ValueError('The marker list must contain all series')
-
-    if line_styles is None:
-        line_styles  = ['-' for s in series]
-    if len(line_styles) != num_series:
-        raise ValueError('The line style list must contain all series')
+    series_labels = _default_or_check(series_labels, num_series, None,
+        'You must define a label for every series')
+    series_errs = _default_or_check(series_errs, num_series, None,
+        'series_errs is not None. Must provide error value for every series.')
+    series_err_colors = _default_or_check(series_err_colors, num_series, 'black',
+        'Must provide an error bar color for every series')
+    series_color_emphasis = _default_or_check(series_color_emphasis, num_series, False,
+        'The emphasis list must be the same length as the series_colors list')
+    plot_markers = _default_or_check(plot_markers, num_series, 'None',
+        'The marker list must contain all series')
+    line_styles = _default_or_check(line_styles, num_series, '-',
+        'The line style list must contain all series')
+    series_errs = [None if errs is None else np.asarray(errs) for errs in series_errs]
+
+    fig, ax = _figure_and_axis(fig, ax, show_plot)
+    _configure_fonts(fontsize, legend_fontsize)
+
+    X, Y = _series_arrays(series)
+
+    # by Shen Li
+    # http://nbviewer.jupyter.org/gist/fonnesbeck/5850463
+    # Add some random "jitter" to the x-axis and/or the y-axis
+    if jitter_x != -1. or jitter_y != -1.:
+        # Negative scales are rejected up front so the numba and numpy paths agree
+        if (jitter_x != -1. and jitter_x < 0) or (jitter_y != -1. and jitter_y < 0):
+            raise ValueError('jitter_x and jitter_y must be non-negative, or -1. for no jitter')
+        X, Y = _stack_series(X, Y)
+        # The numba kernel cannot draw from a caller supplied generator
+        if (rng is None and _apply_jitter is not None and isinstance(Y, np.ndarray)
+                and Y.size >= _COMPILED_JITTER_MIN_SIZE):
+            X, Y = _jitter_compiled(X, Y, jitter_x, jitter_y)
+        else:
+            if rng is None:
+                rng = _rng
+            if jitter_x != -1. and jitter_y != -1. and isinstance(Y, np.ndarray):
+                # Draw the noise for both axes in a single call
+                noise = rng.standard_normal((2,) + Y.shape)
+                X = X + noise[0] * jitter_x
+                Y = Y + noise[1] * jitter_y
+            else:
+                if jitter_x != -1.:
+                    X = _jitter(X, jitter_x, rng)
+                if jitter_y != -1.:
+                    Y = _jitter(Y, jitter_y, rng)
 
-    fig, ax = plt.subplots()
-    plot_utils.configure_fonts(fontsize=fontsize, legend_fontsize=legend_fontsize)
+    palette = _palette(series_colors, series_color_emphasis)
+    has_errs = any(errs is not None for errs in series_errs)
+    # Error colors are only looked up when there are errors to draw
+    err_palette = _palette(series_err_colors) if has_errs else None
 
-    num_series = len(series)
     for idx in range(num_series):
-        xvals = series[idx][0]
-        yvals = numpy.array(series[idx][1])
-        
-        # by Shen Li
-        if jitter_x != -1. and jitter_y == -1.:
-            # http://nbviewer.jupyter.org/gist/fonnesbeck/5850463
-            # Add some random "jitter" to the x-axis
-            xvals = numpy.random.normal(xvals, jitter_x, size=len(yvals))
-        elif jitter_x == -1. and jitter_y != -1.:
-            # http://nbviewer.jupyter.org/gist/fonnesbeck/5850463
-            # Add some random "jitter" to the x-axis
-            yvals = numpy.random.normal(yvals, jitter_y, size=len(xvals))
-        elif jitter_x != -1. and jitter_y != -1.:
-            xs = list(numpy.random.normal(xvals, jitter_x, size=len(yvals)))
-            ys = list(numpy.random.normal(yvals, jitter_y, size=len(xvals)))
-            xvals = xs
-            yvals = ys
+        xvals = X[idx]
+        yvals = Y[idx]
 
         r = ax.plot(xvals, yvals,
             label = series_labels[idx],
-            color = colors.get_plot_color(series_colors[idx], emphasis=series_color_emphasis[idx]),
+            color = palette[idx],
             marker = plot_markers[idx],
             linestyle = line_styles[idx],
             lw = linewidth,
@@ -346,9 +597,9 @@ def plot(series, series_colors,
 
         errs = series_errs[idx]
         if errs is not None:
-            shade_color = colors.get_plot_color(color = series_err_colors[idx])
+            shade_color = err_palette[idx]
             if fill_error:
-                plot_utils.shaded_error(ax, xvals, yvals, numpy.array(errs), color=shade_color)
+                plot_utils.shaded_error(ax, xvals, yvals, errs, color=shade_color)
             else:
                 ax.errorbar(xvals, yvals, yerr=errs, linestyle='None', ecolor=shade_color)
         
@@ -382,7 +633,7 @@ def plot(series, series_colors,
                           legend_fontsize=legend_fontsize)
 
     # Show
-    if show_plot:
+    if show_plot and not _is_non_interactive():
         plt.show()
 
     return fig, ax
@@ -3,17 +3,18 @@ import matplotlib.pyplot as plt
 import numpy
 from colors import *
 
-def configure_fonts(fontsize=15, legend_fontsize=8,
-                      usetex=False, figure_dpi=300):
+def font_settings(fontsize=15, legend_fontsize=8,
+                  usetex=False, figure_dpi=300):
     """
-    Configure fonts. Fonts are set to serif .
+    The rcParams applied by configure_fonts.
     @param fontsize The size of the fonts used on the axis and within the figure
     @param legend_fontsize The size of the legend fonts
     @param usetex If true, configure to use latex for formatting all text
     @param figure_dpi Set the dots per inch for any saved version of the plot
+    @return A dict mapping rcParams keys to their values
     """
     #or Lato (sans serif) or Ubuntu Mono (mono)
-    plt.rcParams.update({
+    return {
             'font.family':'Droid Serif',
             'font.serif':'Droid Serif',
             'font.size': fontsize,
@@ -21,7 +22,20 @@ def configure_fonts(fontsize=15, legend_fontsize=8,
             'legend.labelspacing': 0,
             'text.usetex': usetex,
             'savefig.dpi': figure_dpi
-    })
+    }
+
+
+def configure_fonts(fontsize=15, legend_fontsize=8,
+                      usetex=False, figure_dpi=300):
+    """
+    Configure fonts. Fonts are set to serif .
+    @param fontsize The size of the fonts used on the axis and within the figure
+    @param legend_fontsize The size of the legend fonts
+    @param usetex If true, configure to use latex for formatting all text
+    @param figure_dpi Set the dots per inch for any saved version of the plot
+    """
+    plt.rcParams.update(font_settings(fontsize=fontsize, legend_fontsize=legend_fontsize,
+                                      usetex=usetex, figure_dpi=figure_dpi))
 
 
 def shaded_error(ax, xvals, yvals, errs, color=None):